@@ -1,38 +1,80 @@
 #!/usr/bin/env python3
 
 # Standard library imports
+import functools
+import json
 import os
 import re
 import sys
-from datetime import datetime
+import unicodedata
+from datetime import date, datetime
 
 # Third-party imports
 import yaml
 import difflib
+try:
+    # libyaml-backed loader, parses in C when PyYAML was built with it
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import requests
-import dateparser
 from bs4 import BeautifulSoup
 
 # CONSTANTS
 YAML_FILE = "calendar_headers_list.yaml"
 CALENDAR_URL = "https://exactas.uba.ar/calendario-academico/"
+REQUEST_TIMEOUT = 10  # seconds
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 HEADERS_FILE = os.path.join(SCRIPT_DIR, YAML_FILE)
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                         "exactas-cal2org")
+CACHED_PAGE_FILE = os.path.join(CACHE_DIR, "page.html")
+CACHED_VALIDATORS_FILE = os.path.join(CACHE_DIR, "validators.json")
 
 CURRENT_YEAR = datetime.now().year
 DAYS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+DAYS_SET = frozenset(DAYS)
+# Org-mode timestamps use English weekday abbreviations, whatever the locale
+WEEKDAY_ABBREVIATIONS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 MONTHS_DICT = {
     "enero": "01", "febrero": "02", "marzo": "03", "abril": "04", "mayo": "05", "junio": "06",
     "julio": "07", "agosto": "08", "septiembre": "09", "octubre": "10", "noviembre": "11", "diciembre": "12"
 }
 
+# Shared HTTP session, so repeated fetches reuse the same pooled connection
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip, deflate", "User-Agent": "exactas-cal2org"})
+
+HEADER_TAG_NAMES = ["h1", "h2", "h3", "h4", "h5", "h6"]
+HEADER_TAGS = frozenset(HEADER_TAG_NAMES)
+EXAM_DATE_SUFFIXES = {"Primera": " (1ra fecha)", "Segunda": " (2da fecha)", "Tercera": " (3ra fecha)"}
+
+# Precompiled regexes for detecting possible date formats
+REGEX_DATE_OR_TIMEFRAME = re.compile(
+    r"(?P<start>\w+ \d{1,2})"
+    r"(?: de (?P<start_month>\w+)(?: al (?P<end>\w+ \d{1,2} de \w+))?"  # One date, or days in different months
+    r"| al (?P<end_same_month>\w+ \d{1,2} de \w+))"  # Multiple days in same month
+)
+EVENT_PREFIXES = ["Semana de"]
+EVENT_SUFFIXES = ["de cuatrimestre"]
+REGEX_EVENT_AFFIXES = re.compile(
+    r"^(?:" + "|".join(map(re.escape, EVENT_PREFIXES)) + r")\s*"
+    r"|\s*(?:" + "|".join(map(re.escape, EVENT_SUFFIXES)) + r")\s*$"
+)
+REGEX_EXAM_DATE = re.compile(r"(" + "|".join(EXAM_DATE_SUFFIXES) + r") fecha")  # e.g. "Primera fecha"
+REGEX_EVENT_LINE = re.compile(r"([^:]+):(.*)")  # Event name, then its date or timeframe
+REGEX_DATE = re.compile(r"(\w+) (\d{1,2}) de (\w+)")  # Parts of a single date
+# First three days (any further days are skipped) followed by "de <month>"
+REGEX_WEEK_DATES = re.compile(r"(\d{1,2})\D+(\d{1,2})\D+(\d{1,2})(?:\D+\d{1,2})*\s+de\s+(\w+)")
+
 def strip_event_affixes(event_name):
     """
     Removes predefined prefixes and suffixes from an event name.
 
-    This function trims specific prefixes and suffixes from the given
-    event name, ensuring that the remaining string is clean. It also
-    removes any extra whitespace that may result from the trimming.
+    This function trims the prefixes in `EVENT_PREFIXES` and the suffixes in
+    `EVENT_SUFFIXES` from the given event name in a single regex substitution,
+    ensuring that the remaining string is clean. It also removes any extra
+    whitespace that may result from the trimming.
 
     Parameters:
     event_name (str): The original event name.
@@ -41,25 +83,32 @@ def strip_event_affixes(event_name):
     str: The cleaned event name without the specified prefixes and suffixes.
     """
 
-    prefixes_list = ["Semana de"]
-    suffixes_list = ["de cuatrimestre"]
+    return REGEX_EVENT_AFFIXES.sub("", event_name).strip()
+
+def fold_name(name):
+    """
+    Folds a day or month name to lowercase ASCII for accent- and case-insensitive lookups.
 
-    for prefix in prefixes_list:
-        if event_name.startswith(prefix):
-            event_name = event_name[len(prefix):].strip()
-    for suffix in suffixes_list:
-        if event_name.endswith(suffix):
-            event_name = event_name[:-len(suffix)].strip()
+    Example:
+    >>> fold_name("Miércoles")
+    'miercoles'
+    """
+    return unicodedata.normalize("NFD", name).encode("ascii", "ignore").decode().lower()
 
-    return event_name
+# Folded name -> canonical name, for the exact lookups in the correctors below
+FOLDED_MONTHS = {fold_name(month): month for month in MONTHS_DICT}
+FOLDED_DAYS = {fold_name(day): day for day in DAYS}
 
+@functools.lru_cache(maxsize=256)
 def correct_month_name(month_input):
     """
     Corrects a possibly misspelled month name using approximate matches.
 
     This function takes a month name as input and finds the closest matching
     month from a predefined list of valid months using difflib's get_close_matches
-    function. If the input is misspelled, it returns the closest month.
+    function. Names that only differ in accents or casing are resolved with a dict
+    lookup first. If the input is misspelled, it returns the closest month.
+    Results are memoized, since the same few names recur on every page.
 
     Args:
         month_input (str): The name of the month to be corrected.
@@ -68,18 +117,27 @@ def correct_month_name(month_input):
         list: A list containing the closest matching month found, or an empty list
               if no close match is found.
     """
+    if month_input in MONTHS_DICT:
+        return month_input  # Already a valid month, skip the fuzzy matching
+    folded_month = fold_name(month_input)
+    if folded_month in FOLDED_MONTHS:
+        return FOLDED_MONTHS[folded_month]  # Only differs in accents or casing
+
     months = list(MONTHS_DICT.keys())
     matches = difflib.get_close_matches(month_input, months, n=1)
 
     return matches[0]
 
+@functools.lru_cache(maxsize=256)
 def correct_day_name(dayname_input):
     """
     Corrects a possibly misspelled day name using approximate matches.
 
     This function takes a day name as input and finds the closest matching
     day from a predefined list of valid days using difflib's get_close_matches
-    function. If the input is misspelled, it returns the closest day.
+    function. Names that only differ in accents or casing are resolved with a dict
+    lookup first. If the input is misspelled, it returns the closest day.
+    Results are memoized, since the same few names recur on every page.
 
     Args:
         dayname_input (str): The name of the day to be corrected.
@@ -88,6 +146,12 @@ def correct_day_name(dayname_input):
         list: A list containing the closest matching day found, or an empty list
               if no close match is found.
     """
+    if dayname_input in DAYS_SET:
+        return dayname_input  # Already a valid day, skip the fuzzy matching
+    folded_dayname = fold_name(dayname_input)
+    if folded_dayname in FOLDED_DAYS:
+        return FOLDED_DAYS[folded_dayname]  # Only differs in accents or casing
+
     matches = difflib.get_close_matches(dayname_input, DAYS, n=1)
 
     return matches[0]
@@ -96,13 +160,14 @@ def get_date_or_timeframe(section_text):
     """
     Extracts a date or a date range from a given section of text.
 
-    This function searches for a single date or a date range using predefined regex patterns.
-    It prioritizes matches as follows:
-        1. A single date (e.g., "lunes 15 de marzo")
+    This function scans the text once with a precompiled regex whose named groups
+    tell the supported formats apart. They are prioritized as follows:
+        1. A date range spanning different months (e.g., "lunes 10 de marzo al martes 28 de abril")
         2. A date range within the same month (e.g., "lunes 10 al viernes 15 de marzo")
-        3. A date range spanning different months (e.g., "lunes 10 de marzo al martes 28 de abril")
+        3. A single date (e.g., "lunes 15 de marzo")
 
-    If multiple matches are found, the highest-priority match is returned.
+    If several dates are found, the highest-priority one is returned (the leftmost
+    one among equals), so a range anywhere in the text wins over a single date.
 
     Args:
         section_text (str): The input text containing a potential date or timeframe.
@@ -117,62 +182,104 @@ def get_date_or_timeframe(section_text):
         - If no match is found, the function prints a failure message and `out` remains undefined.
     """
 
-    # Regex for detecting possible date formats
-    regex_fecha_unica = r"(\w+ \d{1,2} de \w+)"  # Just one date
-    regex_plazo_mismo_mes = r"(\w+ \d{1,2}) al (\w+ \d{1,2} de \w+)"  # Multiple days in same month
-    regex_plazo_diferente_mes = r"(\w+ \d{1,2} de \w+) al (\w+ \d{1,2} de \w+)"  # Multiple days in different months
-
-    # Regex list with a priority order
-    regex_list = [
-        (regex_fecha_unica, 3),  # Priority 1: just one date
-        (regex_plazo_mismo_mes, 2),  # Priority 2: multiple days in same month
-        (regex_plazo_diferente_mes, 1)  # Priority 3: multiple days in different months
-    ]
-
-    # List to store found matches
-    matches = []
-
-    # Each regex is tried in the list's order
-    for regex, priority in regex_list:
-        coincidence = re.search(regex, section_text)
-        if coincidence:
-            if len(coincidence.groups()) == 1:
-                # Solo una fecha
-                date = coincidence.group(1)
-                matches.append((date, priority))
-            else:
-                # Es un plazo
-                starting_date = coincidence.group(1)
-                ending_date = coincidence.group(2)
-                matches.append((starting_date, ending_date, priority))
-
-    # If matches found, order them by priority
-    if matches:
-        matches.sort(key=lambda x: x[-1])  # Ordering by last element in the tuples (i.e., priority)
-        # Return match with highest priority
-        if len(matches[0]) == 2:
-            out = [matches[0][0]]
-            single_date_boolean = True
+    # A single pass over the text, keeping the match with the highest priority
+    coincidence = None
+    best_priority = None
+    for candidate in REGEX_DATE_OR_TIMEFRAME.finditer(section_text):
+        if candidate.group("end"):
+            priority = 1  # different months
+        elif candidate.group("end_same_month"):
+            priority = 2  # same month
         else:
-            if matches[0][2] == 2:
-                # same month, get it from second part
-                last_two_words = " ".join(matches[0][1].split()[-2:])
-                out = [matches[0][0] + " " + last_two_words, matches[0][1]]
-            else:
-                out = [matches[0][0], matches[0][1]]
+            priority = 3  # single date
+        if coincidence is None or priority < best_priority:
+            coincidence, best_priority = candidate, priority
+            if priority == 1:
+                break  # Nothing can beat a range across months
+
+    if coincidence:
+        starting_date = coincidence.group("start")
+        if coincidence.group("end_same_month"):
+            # same month, get it from second part
+            ending_date = coincidence.group("end_same_month")
+            last_two_words = " ".join(ending_date.split()[-2:])
+            out = [starting_date + " " + last_two_words, ending_date]
+            single_date_boolean = False
+        elif coincidence.group("end"):
+            # different months, both dates are complete
+            out = [starting_date + " de " + coincidence.group("start_month"), coincidence.group("end")]
             single_date_boolean = False
+        else:
+            # Solo una fecha
+            out = [starting_date + " de " + coincidence.group("start_month")]
+            single_date_boolean = True
     else:
         # If no matches are found
         print('Failed to find date or period in string.')
 
     return out, single_date_boolean
 
+def read_cached_page(url):
+    """
+    Reads the locally cached copy of a webpage, if there is one for the given URL.
+
+    Args:
+        url (str): The URL the cached page must have been fetched from.
+
+    Returns:
+        tuple:
+            - bytes or None: The cached page content, or None if there is no usable cache.
+            - dict: The cached response headers (ETag, Last-Modified, Content-Type).
+    """
+    try:
+        with open(CACHED_VALIDATORS_FILE, "r", encoding="utf-8") as file:
+            validators = json.load(file)
+        with open(CACHED_PAGE_FILE, "rb") as file:
+            content = file.read()
+    except (OSError, ValueError):
+        return None, {}
+
+    if validators.pop("URL", None) != url:
+        return None, {}
+    return content, validators
+
+def write_cached_page(url, response):
+    """
+    Stores a fetched webpage and its cache validators for later conditional requests.
+
+    Failing to write the cache (e.g., on a read-only home directory) is not an error,
+    the next run will simply download the page again.
+
+    Args:
+        url (str): The URL the page was fetched from.
+        response (requests.Response): The successful response holding the page.
+    """
+    validators = {"URL": url}
+    for header in ("ETag", "Last-Modified", "Content-Type"):
+        if header in response.headers:
+            validators[header] = response.headers[header]
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(CACHED_PAGE_FILE, "wb") as file:
+            file.write(response.content)
+        with open(CACHED_VALIDATORS_FILE, "w", encoding="utf-8") as file:
+            json.dump(validators, file)
+    except OSError:
+        pass
+
 def read_html_source_from_url(url):
     """
     Fetches and parses the HTML content from the given URL.
 
-    This function sends an HTTP GET request to the specified URL, checks for
-    request errors, and returns a BeautifulSoup object for further HTML parsing.
+    This function sends an HTTP GET request to the specified URL through the
+    shared `SESSION`, checks for request errors, and returns a BeautifulSoup
+    object for further HTML parsing.
+
+    The page is cached under `CACHE_DIR`. When a cached copy exists the request
+    is made conditional (If-None-Match / If-Modified-Since), and on a
+    "304 Not Modified" answer the cached copy is parsed instead of downloading
+    the unchanged calendar again.
 
     Parameters:
         url (str): The URL of the webpage to fetch.
@@ -182,47 +289,99 @@ def read_html_source_from_url(url):
 
     Raises:
         requests.exceptions.RequestException: If the request fails (e.g., network issues,
-                                              invalid URL, or server error).
+                                              invalid URL, timeout, or server error).
     """
-    response = requests.get(url)
+    cached_content, cached_headers = read_cached_page(url)
+    request_headers = {}
+    if cached_content is not None:
+        if "ETag" in cached_headers:
+            request_headers["If-None-Match"] = cached_headers["ETag"]
+        if "Last-Modified" in cached_headers:
+            request_headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+    response = SESSION.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
     # Verify that the request was successful
     response.raise_for_status()
 
-    # Parse the HTML content of the page
-    soup = BeautifulSoup(response.text, "html.parser")
+    if response.status_code == requests.codes.not_modified:
+        # The calendar did not change since it was cached
+        content = cached_content
+        content_type = cached_headers.get("Content-Type", "")
+    else:
+        content = response.content
+        content_type = response.headers.get("Content-Type", "")
+        write_cached_page(url, response)
+
+    # Parse the raw bytes with lxml, skipping the Unicode decode of response.text.
+    # Use the charset declared in the HTTP headers, if any, so the encoding does
+    # not have to be sniffed from the body (requests would otherwise default to ISO-8859-1)
+    if "charset" in content_type.lower():
+        declared_encoding = requests.utils.get_encoding_from_headers({"Content-Type": content_type})
+    else:
+        declared_encoding = None
+    soup = BeautifulSoup(content, "lxml", from_encoding=declared_encoding)
     return soup
 
-def get_section_lines(soup, target_header):
+def index_section_headers(soup):
     """
-    Extracts text from a section identified by a specific header.
+    Collects every header tag (h1–h6) of the document along with its text.
 
-    This function searches for a header tag (h1–h6) whose text starts with `target_header`
-    and retrieves all text from its section, stopping at the next header of the same or
-    higher level.
+    The document is traversed once, so that looking up each calendar section
+    afterwards does not need another full scan of the page.
 
     Parameters:
         soup (BeautifulSoup): The parsed HTML document.
-        target_header (str): The title of the section to extract.
+
+    Returns:
+        list[tuple[str, Tag]]: The text and tag of each header, in document order.
+    """
+    return [(header_tag.text, header_tag) for header_tag in soup.find_all(HEADER_TAG_NAMES)]
+
+def find_section_header(header_index, target_header):
+    """
+    Finds the first header whose text starts with `target_header`.
+
+    Parameters:
+        header_index (list[tuple[str, Tag]]): The headers, as built by `index_section_headers()`.
+        target_header (str): The title of the section to find.
+
+    Returns:
+        Tag or None: The matching header tag, or None if there is none.
+    """
+    for header_text, header_tag in header_index:
+        if header_text.startswith(target_header):
+            return header_tag
+    return None
+
+def get_section_lines(header):
+    """
+    Extracts text from a section identified by a specific header.
+
+    This function retrieves all text from the section that starts at the given
+    header tag (h1–h6), stopping at the next header of the same or higher level.
+
+    Parameters:
+        header (Tag): The header tag of the section, as found by `find_section_header()`.
 
     Returns:
         list[str]: A list of strings, where each string is a line of text from the section.
 
     Raises:
-        AttributeError: If no matching header is found in the document.
+        AttributeError: If no matching header was found in the document (`header` is None).
     """
 
-    header_list = ["h1", "h2", "h3", "h4", "h5", "h6"]
-    header = soup.find(lambda tag: tag.name in header_list and tag.text.startswith(target_header))
-
     section_text = []
 
-    # Traverse elements until the next header of the same or higher level
-    for sibling in header.find_next_siblings():
-        if sibling.name in header_list:
+    # Lazily traverse elements until the next header of the same or higher level
+    # (find_next_siblings() would collect every remaining sibling up front)
+    for sibling in header.next_siblings:
+        if sibling.name is None:
+            continue  # Skip bare strings between tags
+        if sibling.name in HEADER_TAGS:
             break  # Stop at the next header
 
-        lines_of_text = sibling.get_text(strip=True, separator="\n").split("\n")
-        section_text.extend(lines_of_text)
+        # Split each stripped text node on its own newlines, a single node may hold several lines
+        section_text.extend(line for text in sibling.stripped_strings for line in text.split("\n"))
 
     return section_text
 
@@ -231,7 +390,8 @@ def read_event_list_from_yaml(yaml_file):
     Reads a list of required events from a YAML file.
 
     This function opens the specified file, reads its contents line by line,
-    and returns a list where each line is an event.
+    and returns a list where each line is an event. The file is parsed with
+    libyaml's CSafeLoader when available, falling back to the pure-Python SafeLoader.
 
     Parameters:
         file (str): The path to the file containing the event list.
@@ -246,7 +406,7 @@ def read_event_list_from_yaml(yaml_file):
 
     # Read YAML file
     with open(yaml_file, "r", encoding="utf-8") as file:
-        required_events = yaml.safe_load(file)
+        required_events = yaml.load(file, Loader=SafeLoader)
 
     return required_events
 
@@ -267,45 +427,64 @@ def normalize_event_casing(event_name):
     >>> normalize_event_casing("science Fair")
     'Science fair'
     """
-    return event_name.lower().capitalize()
+    if event_name[:1].isupper() and event_name[1:].islower():
+        return event_name  # Already normalized, avoid building a new string
 
-def parse_date_from_string(date_in_text_format):
+    # capitalize() already lowercases the rest of the string in the same pass
+    return event_name.capitalize()
+
+@functools.lru_cache(maxsize=512)
+def parse_date_from_string(date_in_text_format, year):
     """
     Parses a date from a text string and converts it to a standardized date format.
 
     This function extracts a date from a given string using a predefined regex pattern.
-    It corrects any typos in the day name and month name before reconstructing the date
-    in natural language and converting it to a universal date format.
+    It corrects any typo in the month name and builds the date directly from the day
+    number and the month number in `MONTHS_DICT`, for the given year. The function
+    is pure, so its results are memoized: the same dates recur across events
+    (e.g. a period ending the day another one starts).
 
     Args:
         date_in_text_format (str): A date string in the format "dayname daynumber de monthname"
                                    (e.g., "lunes 15 de marzo").
+        year (int): The year the date belongs to (usually `CURRENT_YEAR`).
 
     Returns:
         datetime.date: The parsed date in a universal format (YYYY-MM-DD).
 
     Notes:
         - The function assumes that the input string contains a valid date in Spanish.
-        - It uses `correct_day_name` and `correct_month_name` to fix potential typos.
-        - The final date is parsed using `dateparser.parse` and returned in the standard date format.
+        - It uses `correct_month_name` to fix potential typos; the day name is not needed,
+          since the weekday follows from the date itself.
+        - The date is built the same way as in `create_org_contents_from_holidays_header`,
+          without going through a natural-language date parser.
     """
-    regex_date = r"(\w+) (\d{1,2}) de (\w+)"
-
     # separate each part of the date expression in natural language
-    coincidence = re.search(regex_date, date_in_text_format)
-    dayname, daynumber, monthname = coincidence.groups()
+    # (the date is always at the start of the string, so an anchored match suffices)
+    coincidence = REGEX_DATE.match(date_in_text_format)
+    _, daynumber, monthname = coincidence.groups()
 
-    # correct typos in dayname and monthname
-    dayname = correct_day_name(dayname)
+    # correct typos in monthname
     monthname = correct_month_name(monthname)
 
-    # regenerate date in natural language with corrected typos (if any)
-    date_in_natural_language = " ".join([dayname, daynumber, monthname])
     # convert to universal format
-    date_in_universal_format = dateparser.parse(date_in_natural_language).date()
+    date_in_universal_format = date(year, int(MONTHS_DICT[monthname]), int(daynumber))
 
     return date_in_universal_format
 
+def format_org_timestamp(date_for_event):
+    """
+    Formats a date as an active Org-mode timestamp.
+
+    Equivalent to `date_for_event.strftime("<%Y-%m-%d %a>")` in the C locale, but
+    builds the weekday from `WEEKDAY_ABBREVIATIONS` instead of querying the locale.
+
+    Example:
+    >>> format_org_timestamp(date(2025, 6, 15))
+    '<2025-06-15 Sun>'
+    """
+    return f"<{date_for_event.isoformat()} {WEEKDAY_ABBREVIATIONS[date_for_event.weekday()]}>"
+
 def create_org_contents_from_calendar_headers(soup, cal_headers):
     """
     Extracts events from calendar headers and formats them as an Org-mode file structure,
@@ -319,23 +498,23 @@ def create_org_contents_from_calendar_headers(soup, cal_headers):
         cal_headers (dict): A dictionary where keys are full calendar section names and values
                             are their short names for Org-mode formatting.
 
-    Outputs:
-        - Prints an Org-mode structured outline of the extracted events, formatted as follows:
+    Returns:
+        str: An Org-mode structured outline of the extracted events, formatted as follows:
             * <Current Year>
             ** <Calendar Header>
             *** <Short Name> <Event Name> (optional suffix for multiple exam dates)
                 <Formatted Date>  (or a date range in Org-mode syntax)
 
     Processing Steps:
-        1. Prints the current year as the top-level heading.
+        1. Adds the current year as the top-level heading.
         2. Iterates through the provided calendar headers:
-           - Extracts section text using `get_section_lines()`.
+           - Extracts section text using `find_section_header()` and `get_section_lines()`.
            - Identifies specific exam dates ("Primera fecha", "Segunda fecha", etc.).
-           - Splits event lines into event names and their corresponding dates.
+           - Splits the remaining event lines ("name: date") into event names and their dates.
            - Determines if the event has a single date or a timeframe.
            - Parses the date(s) using `parse_date_from_string()`.
            - Normalizes event name formatting with `normalize_event_casing()`.
-           - Prints the event as an Org-mode entry.
+           - Adds the event as an Org-mode entry.
 
     Notes:
         - Single dates are formatted as `<YYYY-MM-DD Day>`.
@@ -353,47 +532,54 @@ def create_org_contents_from_calendar_headers(soup, cal_headers):
 
     """
 
-    print("* " + str(CURRENT_YEAR))
-    print("** FECHAS DE CURSADA Y DE FINALES")
+    output_lines = ["* " + str(CURRENT_YEAR), "** FECHAS DE CURSADA Y DE FINALES"]
+
+    # Collect the document headers once, instead of scanning the page for each calendar header
+    header_index = index_section_headers(soup)
 
     for cal_header, cal_header_short_name in cal_headers.items():
-        print("*** " + cal_header)
-        section_text = get_section_lines(soup, cal_header)
+        output_lines.append("*** " + cal_header)
+        section_text = get_section_lines(find_section_header(header_index, cal_header))
         extra_suffix_for_multiple_exam_dates = ''
         for line in section_text:
-            if "Primera fecha" in line:
-                extra_suffix_for_multiple_exam_dates = " (1ra fecha)"
-            elif "Segunda fecha" in line:
-                extra_suffix_for_multiple_exam_dates = " (2da fecha)"
-            elif "Tercera fecha" in line:
-                extra_suffix_for_multiple_exam_dates = " (3ra fecha)"
+            # Lines announcing one of several exam dates take precedence, even with a ":"
+            exam_date = REGEX_EXAM_DATE.search(line)
+            if exam_date:
+                extra_suffix_for_multiple_exam_dates = EXAM_DATE_SUFFIXES[exam_date.group(1)]
+                continue
+
+            event_line = REGEX_EVENT_LINE.match(line)
+            if event_line is None:
+                continue  # Neither an exam date marker nor an event line
+
+            # Conversion to ORG-MODE FORMAT
+            event_name, event_date_or_timeframe = event_line.groups()
+            date_or_timeframe, is_single_date = get_date_or_timeframe(event_date_or_timeframe)
+            if is_single_date:
+                # it is just a simple date
+                date_for_event = parse_date_from_string(date_or_timeframe[0], CURRENT_YEAR)
+                formatted_date_for_event = format_org_timestamp(date_for_event)
+                event_name = normalize_event_casing(event_name)
+                output_lines.append("**** " + cal_header_short_name + " " + event_name +
+                    extra_suffix_for_multiple_exam_dates)
+                output_lines.append(formatted_date_for_event)
             else:
-                # Conversion to ORG-MODE FORMAT
-                event_name, event_date_or_timeframe = line.split(':')
-                date_or_timeframe, is_single_date = get_date_or_timeframe(event_date_or_timeframe)
-                if is_single_date:
-                    # it is just a simple date
-                    date_for_event = parse_date_from_string(date_or_timeframe[0])
-                    formatted_date_for_event = date_for_event.strftime("<%Y-%m-%d %a>")
-                    event_name = normalize_event_casing(event_name)
-                    print("**** " + cal_header_short_name + " " + event_name +
-                        extra_suffix_for_multiple_exam_dates)
-                    print(formatted_date_for_event)
-                else:
-                    # it is a timeframe (two dates: start and end)
-                    period = []
-                    for each_date in date_or_timeframe:
-                        date_for_event = parse_date_from_string(each_date)
-                        formatted_date_for_event = date_for_event.strftime("<%Y-%m-%d %a>")
-                        period.append(formatted_date_for_event)
-                    # Join both dates (start and end) with "-" for ORG-MODE
-                    period = "-".join(period)
-                    event_name = strip_event_affixes(event_name)
-                    # Hagamoslo lowercase, luego capitalizamos la primera letra
-                    event_name = normalize_event_casing(event_name)
-                    print("**** " + cal_header_short_name + " " + event_name +
-                        extra_suffix_for_multiple_exam_dates)
-                    print(period)
+                # it is a timeframe (two dates: start and end)
+                period = []
+                for each_date in date_or_timeframe:
+                    date_for_event = parse_date_from_string(each_date, CURRENT_YEAR)
+                    formatted_date_for_event = format_org_timestamp(date_for_event)
+                    period.append(formatted_date_for_event)
+                # Join both dates (start and end) with "-" for ORG-MODE
+                period = "-".join(period)
+                event_name = strip_event_affixes(event_name)
+                # Hagamoslo lowercase, luego capitalizamos la primera letra
+                event_name = normalize_event_casing(event_name)
+                output_lines.append("**** " + cal_header_short_name + " " + event_name +
+                    extra_suffix_for_multiple_exam_dates)
+                output_lines.append(period)
+
+    return "\n".join(output_lines)
 
 def get_events_from_yaml_file():
     """
@@ -444,7 +630,10 @@ def get_events_from_yaml_file():
 
 
 def main():
-    """Fetch the academic calendar, extract events, and print them in Org-mode format."""
+    """Fetch the academic calendar, extract events, and print them in Org-mode format.
+
+    Each section is built in full and then written to stdout with a single call.
+    """
 
     # Fetch and parse the HTML source using BeautifulSoup
     soup = read_html_source_from_url(CALENDAR_URL)
@@ -457,12 +646,15 @@ def main():
     # by one of the three types of header: cursada, semanas, feriados
     headers_cursada, headers_semanas, include_holidays = get_events_from_yaml_file()
 
+    # Write each section with a single call as soon as it is built. Diagnostics printed
+    # while building a section (e.g. "Mes no encontrado en el texto.") thus keep their
+    # place in the output, right before that section.
     if headers_cursada is not None:
-        create_org_contents_from_calendar_headers(soup, headers_cursada)
+        sys.stdout.write(create_org_contents_from_calendar_headers(soup, headers_cursada) + "\n")
     if include_holidays is not None:
-        create_org_contents_from_holidays_header(soup)
+        sys.stdout.write(create_org_contents_from_holidays_header(soup) + "\n")
     if headers_semanas is not None:
-        create_org_contents_from_science_weeks_header(soup, headers_semanas)
+        sys.stdout.write(create_org_contents_from_science_weeks_header(soup, headers_semanas) + "\n")
 
     return 0
 
@@ -473,13 +665,13 @@ def create_org_contents_from_holidays_header(soup):
 
     This function locates the last `<table>` element in the parsed HTML,
     extracts holiday details from its rows, and converts the dates into
-    a standardized format. The formatted output is printed in Org-mode syntax.
+    a standardized format. The formatted output is returned in Org-mode syntax.
 
     Args:
         soup: A BeautifulSoup object representing the parsed HTML document.
 
     Returns:
-        None. The formatted holiday entries are printed to the console.
+        str: The Org-mode holidays section with all formatted holiday entries.
 
     Notes:
         - The function assumes the last table in the HTML contains holiday data.
@@ -497,63 +689,64 @@ def create_org_contents_from_holidays_header(soup):
     # Holidays are listed in the last table of the website
     holidays_table = soup.find_all("table")[-1]
 
-    output_text = "** FERIADOS\n"
+    output_parts = ["** FERIADOS"]
 
     # Iterate over all table rows
     for row in holidays_table.find_all("tr"):
-        # Extract all (td) cells from row
-        cells = row.find_all("td")
+        # Extract the (td) cells, which are direct children of the row
+        cells = row.find_all("td", recursive=False)
         if cells:  # Verify there are cells in the row
             # Extract the text of each cell, stripping white space and correcting for possible typos
-            day_name = cells[0].get_text(strip=True)
+            day_name, date_in_text_format, event, condition = [
+                cell.get_text(strip=True) for cell in cells[:4]
+            ]
             day_name = correct_day_name(day_name)
-            date_in_text_format = cells[1].get_text(strip=True)
-            event = cells[2].get_text(strip=True)
-            condition = cells[3].get_text(strip=True)
             if not condition:
                 condition = "No especificada en el sitio web"
 
             # We convert date_in_text_format (e.g., 23 de abril) to "YYYY-MM-DD" format
             try:
                 day_number, month_name = [x.strip() for x in date_in_text_format.split("de")]
+                # correct_month_name always returns a (lowercase) key of MONTHS_DICT
                 month_name = correct_month_name(month_name)
-                month_number = MONTHS_DICT[month_name.lower()]
+                month_number = MONTHS_DICT[month_name]
                 formatted_date_for_heading = f"{CURRENT_YEAR}-{month_number}-{day_number.zfill(2)}"
             except (ValueError, KeyError):
                 formatted_date_for_heading = "Fecha inválida"
 
             # Build the holiday entry for current line in table
-            output_text += f"*** Feriado: {event} ({day_name} {day_number} de {month_name})\n"
-            output_text += f"<{formatted_date_for_heading}>\n"
-            output_text += f"Condición: {condition}.\n"
+            output_parts.append(f"*** Feriado: {event} ({day_name} {day_number} de {month_name})")
+            output_parts.append(f"<{formatted_date_for_heading}>")
+            output_parts.append(f"Condición: {condition}.")
 
-    # Remove extra "\n" that adds unwanted space after last entry
-    output_text = output_text.rstrip("\n")
+    # Joining with "\n" leaves no unwanted space after last entry
+    output_text = "\n".join(output_parts)
 
-    # Print the holidays section
-    print(output_text)
-    return None
+    return output_text
 
 
-def add_entry_for_science_week(soup, science_week_name):
+def add_entry_for_science_week(tag, science_week_name):
     """
     Extracts and formats the date range for a given science week from an HTML document.
 
-    This function searches for a `<strong>` tag containing the specified science week name
-    in a BeautifulSoup-parsed HTML document. If found, it extracts the following sibling text,
+    This function takes the `<strong>` tag containing the specified science week name
+    (as looked up by the caller). If found, it extracts the following sibling text,
     attempts to identify a month and corresponding dates, and formats them in Org-mode syntax.
 
     Args:
-        soup: A BeautifulSoup object representing the parsed HTML document.
-        science_week_name (str): The name of the science week to search for.
+        tag: The BeautifulSoup `<strong>` tag holding the science week name, or None
+             if it is not present in the page.
+        science_week_name (str): The name of the science week.
 
     Returns:
-        None. The formatted entry is printed to the console.
+        str: The formatted Org-mode entry, or an empty string if the week could not be found.
 
     Notes:
         - The function relies on `MONTHS_DICT`, a dictionary mapping month names to their
           respective numerical values.
-        - The extracted dates are expected to follow the pattern "day1, day2, day3 month".
+        - The extracted dates are expected to follow the pattern "day1, day2 y day3 de month";
+          the entry spans from the first to the third day.
+        - If no days followed by a recognizable month are found, "Mes no encontrado" is reported.
         - The formatted output follows the pattern:
           ```
           *** Science Week Name
@@ -563,8 +756,6 @@ def add_entry_for_science_week(soup, science_week_name):
 
     output_text = ""
 
-    tag = soup.find("strong", string=science_week_name)
-
     if tag:
         # Get next sibling containing the text following the match
         science_week_dates_in_text_format = tag.find_next_sibling(string=True)  # Using 'string=True' to get only the text
@@ -572,22 +763,23 @@ def add_entry_for_science_week(soup, science_week_name):
             # Clean up text and separate dates (3 days)
             science_week_dates_in_text_format = science_week_dates_in_text_format.strip()
 
-            for month in MONTHS_DICT:
-                if month in science_week_dates_in_text_format.lower():
-                    # Get the month number
-                    month_number = MONTHS_DICT[month]
-                    # Extract only days using regex
-                    days = re.findall(r'\d+', science_week_dates_in_text_format.split(month)[0])
-
-                    # Build a list of dates in YYYY-MM-DD format
-                    dates = []
-                    for day in days:
-                        date = datetime(CURRENT_YEAR, int(month_number), int(day)).date()
-                        dates.append(date.strftime('%Y-%m-%d'))
-
-                    output_text += f"*** {science_week_name}\n"
-                    output_text += f"<{dates[0]}>-<{dates[2]}>\n"
-                    break
+            # Get the first three days and the month in a single regex pass
+            week_match = REGEX_WEEK_DATES.search(science_week_dates_in_text_format.lower())
+            month_number = None
+            if week_match:
+                first_day, _, last_day, month = week_match.groups()
+                # Get the month number, correcting for possible typos
+                try:
+                    month_number = int(MONTHS_DICT[correct_month_name(month)])
+                except IndexError:
+                    pass  # Not a month name, not even a misspelled one
+
+            if month_number is not None:
+                # Build the first and last dates in YYYY-MM-DD format
+                start = date(CURRENT_YEAR, month_number, int(first_day))
+                end = date(CURRENT_YEAR, month_number, int(last_day))
+
+                output_text = f"*** {science_week_name}\n<{start:%Y-%m-%d}>-<{end:%Y-%m-%d}>\n"
             else:
                 print("Mes no encontrado en el texto.")
         else:
@@ -601,9 +793,11 @@ def create_org_contents_from_science_weeks_header(soup, headers_semanas):
     """
     Generate an Org-mode formatted content section for "Semanas de las Ciencias".
 
-    This function prints a section header for "Semanas de las Ciencias" and iterates
+    This function builds a section header for "Semanas de las Ciencias" and iterates
     over the provided dictionary of science week headers, calling
-    `add_entry_for_science_week` for each entry.
+    `add_entry_for_science_week` for each entry. All `<strong>` tags are indexed
+    by their text in a single pass over the document, instead of searching it
+    once per science week.
 
     Args:
         soup: A BeautifulSoup object representing the parsed HTML document.
@@ -611,15 +805,21 @@ def create_org_contents_from_science_weeks_header(soup, headers_semanas):
                                 science week identifiers.
 
     Returns:
-        None
+        str: The Org-mode science weeks section.
     """
 
-    output_text = "** SEMANAS DE LAS CIENCIAS\n"
+    # Keep the first tag for each text, as soup.find("strong", string=...) would
+    strong_tags = {}
+    for strong_tag in soup.find_all("strong"):
+        if strong_tag.string is not None:
+            strong_tags.setdefault(strong_tag.string, strong_tag)
+
+    output_parts = ["** SEMANAS DE LAS CIENCIAS\n"]
     for individual_science_week in headers_semanas.keys():
-        output_text += add_entry_for_science_week(soup, individual_science_week)
+        output_parts.append(add_entry_for_science_week(strong_tags.get(individual_science_week),
+                                                       individual_science_week))
 
-    print(output_text)
-    return None
+    return "".join(output_parts)
 
 if __name__ == '__main__':
     sys.exit(main())